@@ -358,6 +358,10 @@ def tests(session: Session, pandas: str, extra: str) -> None:
                 "-q",
                 f"--hypothesis-profile={profile}",
             ]
+        elif extra == "io":
+            # io tests don't share mutable state, so they can be distributed
+            # across workers via pytest-xdist
+            args = ["-n=auto"]
         args += [
             f"--cov={PACKAGE}",
             "--cov-report=term-missing",
@@ -895,6 +895,11 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         if not isinstance(other, type(self)):
             return NotImplemented
 
+        # avoid traversing all columns and checks when comparing a schema
+        # against itself.
+        if self is other:
+            return True
+
         def _compare_dict(obj):
             return {
                 k: v for k, v in obj.__dict__.items() if k != "_IS_INFERRED"
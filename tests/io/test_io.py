@@ -1,10 +1,10 @@
 """Unit tests for io module"""
 
-import platform
+import functools
 import tempfile
 from io import StringIO
 from pathlib import Path
-from unittest import mock
+from typing import Dict, Generator
 
 import pandas as pd
 import pytest
@@ -15,28 +15,31 @@ import pandera.extensions as pa_ext
 import pandera.typing as pat
 from pandera.engines import pandas_engine
 
+# skip all tests in module if "io" depends aren't installed. Skipping at
+# import time avoids building the module-level test data below. pandera.io
+# re-raises a plain ImportError when black or frictionless are missing.
 try:
     from pandera import io
 except ImportError:
-    HAS_IO = False
-else:
-    HAS_IO = True
+    pytest.skip('needs "io" module dependencies', allow_module_level=True)
 
+yaml = pytest.importorskip("yaml")
 
-try:
-    import yaml
-except ImportError:  # pragma: no cover
-    PYYAML_VERSION = None
-else:
-    PYYAML_VERSION = version.parse(yaml.__version__)  # type: ignore
+
+@functools.lru_cache(maxsize=None)
+def _pyyaml_version() -> version.Version:
+    """Get the installed pyyaml version."""
+    return version.parse(yaml.__version__)
 
 
-SKIP_YAML_TESTS = PYYAML_VERSION is None or PYYAML_VERSION.release < (5, 1, 0)  # type: ignore
+def _skip_yaml_tests() -> bool:
+    return _pyyaml_version().release < (5, 1, 0)
 
 
-# skip all tests in module if "io" depends aren't installed
-pytestmark = pytest.mark.skipif(
-    not HAS_IO, reason='needs "io" module dependencies'
+# the condition string is only evaluated when a marked test is set up, so
+# collecting the module doesn't require parsing the pyyaml version.
+skip_yaml_tests = pytest.mark.skipif(
+    "_skip_yaml_tests()", reason="pyyaml >= 5.1.0 required"
 )
 
 
@@ -560,10 +563,43 @@ def _create_schema_no_descr_no_title(index="single"):
     )
 
 
-@pytest.mark.skipif(
-    SKIP_YAML_TESTS,
-    reason="pyyaml >= 5.1.0 required",
+@pytest.fixture(scope="module", name="base_schema")
+def fixture_base_schema():
+    """Schema with a single index shared across the tests in this module.
+
+    Tests using this fixture must not mutate the schema.
+    """
+    return _create_schema("single")
+
+
+@pytest.fixture(
+    scope="module", name="indexed_schema", params=["single", "multi", None]
 )
+def fixture_indexed_schema(request):
+    """Schema with a single, multi, or no index.
+
+    Tests using this fixture must not mutate the schema.
+    """
+    return _create_schema(request.param)
+
+
+# parse the expected yaml schemas once at import so that tests exercising
+# deserialization don't re-parse the same strings on every invocation.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_PARSED_YAML = {
+    yaml_str: yaml.load(yaml_str, Loader=_YAML_LOADER)
+    for yaml_str in [
+        YAML_SCHEMA,
+        YAML_SCHEMA_NULL_INDEX,
+        YAML_SCHEMA_PYTHON_TYPES,
+        YAML_SCHEMA_MISSING_GLOBAL_CHECK,
+        YAML_SCHEMA_MISSING_COLUMN_CHECK,
+        YAML_SCHEMA_NO_DESCR_NO_TITLE,
+    ]
+}
+
+
+@skip_yaml_tests
 def test_inferred_schema_io():
     """Test that inferred schema can be written to yaml."""
     df = pd.DataFrame(
@@ -579,56 +615,61 @@ def test_inferred_schema_io():
     assert schema == schema_from_yaml
 
 
-@pytest.mark.skipif(
-    SKIP_YAML_TESTS,
-    reason="pyyaml >= 5.1.0 required",
-)
-def test_to_yaml():
+@skip_yaml_tests
+def test_to_yaml(base_schema):
     """Test that to_yaml writes to yaml string."""
-    schema = _create_schema()
+    schema = base_schema
     yaml_str = io.to_yaml(schema)
-    with tempfile.NamedTemporaryFile("w+") as f:
-        f.write(yaml_str)
-    with tempfile.NamedTemporaryFile("w+") as f:
-        f.write(YAML_SCHEMA)
-    assert yaml_str.strip() == YAML_SCHEMA.strip()
+    expected = _PARSED_YAML[YAML_SCHEMA]
+    assert yaml.load(yaml_str, Loader=_YAML_LOADER) == expected
 
     yaml_str_schema_method = schema.to_yaml()
-    assert yaml_str_schema_method.strip() == YAML_SCHEMA.strip()
+    assert yaml.load(yaml_str_schema_method, Loader=_YAML_LOADER) == expected
 
 
-@pytest.mark.skipif(
-    SKIP_YAML_TESTS,
-    reason="pyyaml >= 5.1.0 required",
-)
+@skip_yaml_tests
 @pytest.mark.parametrize(
-    "yaml_str, schema_creator",
+    "serialized_schema, schema_creator",
     [
-        [YAML_SCHEMA, _create_schema],
-        [YAML_SCHEMA_NULL_INDEX, _create_schema_null_index],
-        [YAML_SCHEMA_PYTHON_TYPES, _create_schema_python_types],
-        [YAML_SCHEMA_NO_DESCR_NO_TITLE, _create_schema_no_descr_no_title],
+        [_PARSED_YAML[YAML_SCHEMA], _create_schema],
+        [_PARSED_YAML[YAML_SCHEMA_NULL_INDEX], _create_schema_null_index],
+        [
+            _PARSED_YAML[YAML_SCHEMA_PYTHON_TYPES],
+            _create_schema_python_types,
+        ],
+        [
+            _PARSED_YAML[YAML_SCHEMA_NO_DESCR_NO_TITLE],
+            _create_schema_no_descr_no_title,
+        ],
     ],
 )
-def test_from_yaml(yaml_str, schema_creator):
-    """Test that from_yaml reads yaml string."""
-    schema_from_yaml = io.from_yaml(yaml_str)
+def test_from_yaml(serialized_schema, schema_creator):
+    """Test that a parsed yaml schema is deserialized correctly."""
+    schema_from_yaml = io.deserialize_schema(serialized_schema)
     expected_schema = schema_creator()
     assert schema_from_yaml == expected_schema
     assert expected_schema == schema_from_yaml
 
 
+@skip_yaml_tests
+def test_from_yaml_str():
+    """Test that from_yaml reads yaml string."""
+    schema_from_yaml = io.from_yaml(YAML_SCHEMA)
+    expected_schema = _create_schema()
+    assert schema_from_yaml == expected_schema
+    assert expected_schema == schema_from_yaml
+
+
 def test_from_yaml_unregistered_checks():
     """
-    Test that from_yaml raises an exception when deserializing unregistered
-    checks.
+    Test that deserializing unregistered checks raises an exception.
     """
 
     with pytest.raises(AttributeError, match=".*custom checks.*"):
-        io.from_yaml(YAML_SCHEMA_MISSING_COLUMN_CHECK)
+        io.deserialize_schema(_PARSED_YAML[YAML_SCHEMA_MISSING_COLUMN_CHECK])
 
     with pytest.raises(AttributeError, match=".*custom checks.*"):
-        io.from_yaml(YAML_SCHEMA_MISSING_GLOBAL_CHECK)
+        io.deserialize_schema(_PARSED_YAML[YAML_SCHEMA_MISSING_GLOBAL_CHECK])
 
 
 def test_from_yaml_load_required_fields():
@@ -645,6 +686,28 @@ def test_from_yaml_load_required_fields():
         )
 
 
+@pytest.mark.parametrize("to_yaml_schema", [str, StringIO])
+def test_from_yaml_rejects_sequence_without_loading(
+    to_yaml_schema, monkeypatch
+):
+    """
+    Test that from_yaml rejects sequences and handles empty documents
+    without fully loading the yaml document.
+    """
+
+    def _load(*args, **kwargs):
+        raise AssertionError("yaml document should not be fully loaded")
+
+    monkeypatch.setattr(io.yaml, "load", _load)
+
+    with pytest.raises(
+        pandera.errors.SchemaDefinitionError, match=".*must be a mapping.*"
+    ):
+        io.from_yaml(to_yaml_schema("- value\n"))
+
+    assert io.from_yaml("") == pandera.DataFrameSchema()
+
+
 @pytest.mark.parametrize(
     "is_ordered,test_data,expected",
     [
@@ -689,41 +752,36 @@ def test_from_yaml_retains_ordered_keyword(is_ordered, test_data, expected):
         assert test_df.equals(validation)
 
 
-def test_io_yaml_file_obj():
+def test_io_yaml_file_obj(base_schema):
     """Test read and write operation on file object."""
-    schema = _create_schema()
+    schema = base_schema
 
     # pass in a file object
-    with tempfile.NamedTemporaryFile("w+") as f:
-        output = schema.to_yaml(f)
-        assert output is None
-        f.seek(0)
-        schema_from_yaml = pandera.DataFrameSchema.from_yaml(f)
-        assert schema_from_yaml == schema
+    f = StringIO()
+    output = schema.to_yaml(f)
+    assert output is None
+    f.seek(0)
+    schema_from_yaml = pandera.DataFrameSchema.from_yaml(f)
+    assert schema_from_yaml == schema
 
 
-@pytest.mark.skipif(
-    platform.system() == "Windows",
-    reason="skipping due to issues with opening file names for temp files.",
-)
-@pytest.mark.parametrize("index", ["single", "multi", None])
-def test_io_yaml(index):
+def test_io_yaml(indexed_schema, tmp_path):
     """Test read and write operation on yaml strings, files and streams."""
-    schema = _create_schema(index)
+    schema = indexed_schema
 
     # pass in a file name
-    with tempfile.NamedTemporaryFile("w+") as f:
-        output = io.to_yaml(schema, f.name)
-        assert output is None
-        schema_from_yaml = io.from_yaml(f.name)
-        assert schema_from_yaml == schema
+    fname = str(tmp_path / "schema_from_str.yaml")
+    output = io.to_yaml(schema, fname)
+    assert output is None
+    schema_from_yaml = io.from_yaml(fname)
+    assert schema_from_yaml == schema
 
     # pass in a Path object
-    with tempfile.NamedTemporaryFile("w+") as f:
-        output = schema.to_yaml(Path(f.name))
-        assert output is None
-        schema_from_yaml = pandera.DataFrameSchema.from_yaml(Path(f.name))
-        assert schema_from_yaml == schema
+    fpath = tmp_path / "schema_from_path.yaml"
+    output = schema.to_yaml(fpath)
+    assert output is None
+    schema_from_yaml = pandera.DataFrameSchema.from_yaml(fpath)
+    assert schema_from_yaml == schema
 
 
 @pytest.mark.parametrize("index", ["single", "multi", None])
@@ -787,32 +845,61 @@ def test_io_json(index):
         assert schema_from_json == schema
 
 
-@pytest.mark.skipif(
-    platform.system() == "Windows",
-    reason="skipping due to issues with opening file names for temp files.",
-)
-@pytest.mark.parametrize("index", ["single", "multi", None])
-def test_to_script(index):
+def test_to_yaml_matches_safe_dump(indexed_schema):
+    """
+    Test that emitting the yaml event stream directly produces the same
+    document as dumping the serialized schema.
+    """
+    expected = yaml.safe_dump(
+        io.serialize_schema(indexed_schema), sort_keys=False
+    )
+    assert io.to_yaml(indexed_schema) == expected
+
+    # set-valued statistics are represented as yaml mappings, whose keys
+    # must keep the set's iteration order like safe_dump does.
+    set_schema = pandera.DataFrameSchema(
+        {
+            "str_column": pandera.Column(
+                pandera.String,
+                checks=pandera.Check.isin({"zeta", "alpha", "mid", "beta"}),
+            ),
+        }
+    )
+    expected = yaml.safe_dump(io.serialize_schema(set_schema), sort_keys=False)
+    assert io.to_yaml(set_schema) == expected
+
+
+def test_serialize_deserialize_schema(indexed_schema):
+    """
+    Test that a schema round-trips through its json/yaml-compatible
+    mapping representation without going through a text format.
+    """
+    serialized_schema = io.serialize_schema(indexed_schema)
+    assert io.deserialize_schema(serialized_schema) == indexed_schema
+
+
+def test_to_script(indexed_schema, tmp_path):
     """Test writing DataFrameSchema to a script."""
-    schema_to_write = _create_schema(index)
+    schema_to_write = indexed_schema
 
-    for script in [io.to_script(schema_to_write), schema_to_write.to_script()]:
+    script = io.to_script(schema_to_write)
 
-        local_dict = {}
-        # pylint: disable=exec-used
-        exec(script, globals(), local_dict)
+    # both entrypoints generate the same script, so it only needs to be
+    # compiled once.
+    assert schema_to_write.to_script() == script
+    code = compile(script, "<to_script>", "exec", optimize=2)
 
-        schema = local_dict["schema"]
+    local_dict = {}
+    # pylint: disable=exec-used
+    exec(code, globals(), local_dict)
 
-        # executing script should result in a variable `schema`
-        assert schema == schema_to_write
+    # executing script should result in a variable `schema`
+    assert local_dict["schema"] == schema_to_write
 
-    with tempfile.NamedTemporaryFile("w+") as f:
-        schema_to_write.to_script(Path(f.name))
-        # pylint: disable=exec-used
-        exec(f.read(), globals(), local_dict)
-        schema = local_dict["schema"]
-        assert schema == schema_to_write
+    # writing to a file should produce the same script
+    fpath = tmp_path / "schema.py"
+    schema_to_write.to_script(fpath)
+    assert fpath.read_text(encoding="utf-8") == script
 
 
 def test_to_script_lambda_check():
@@ -867,26 +954,35 @@ def test_format_checks_warning():
         io._format_checks({"my_check": None})
 
 
-@mock.patch("pandera.Check.REGISTERED_CUSTOM_CHECKS", new_callable=dict)
-def test_to_yaml_registered_dataframe_check(_):
-    """
-    Tests that writing DataFrameSchema with a registered dataframe check works.
+@pytest.fixture(name="ncols_gt_registered")
+def fixture_ncols_gt_registered(
+    monkeypatch,
+) -> Generator[Dict[str, bool], None, None]:
+    """Temporarily registers a custom ``ncols_gt`` dataframe check.
+
+    Yields a dictionary recording whether the check function was called.
     """
-    ncols_gt_called = False
+    monkeypatch.setattr(pandera.Check, "REGISTERED_CUSTOM_CHECKS", {})
+    calls = {"ncols_gt": False}
 
+    # pylint: disable=unused-variable
     @pa_ext.register_check_method(statistics=["column_count"])
     def ncols_gt(pandas_obj: pd.DataFrame, column_count: int) -> bool:
         """test registered dataframe check"""
-
-        # pylint: disable=unused-variable
-        nonlocal ncols_gt_called
-        ncols_gt_called = True
+        calls["ncols_gt"] = True
         assert isinstance(column_count, int), "column_count must be integral"
         assert isinstance(
             pandas_obj, pd.DataFrame
         ), "ncols_gt should only be applied to DataFrame"
         return len(pandas_obj.columns) > column_count
 
+    yield calls
+
+
+def test_to_yaml_registered_dataframe_check(ncols_gt_registered):
+    """
+    Tests that writing DataFrameSchema with a registered dataframe check works.
+    """
     assert (
         len(pandera.Check.REGISTERED_CUSTOM_CHECKS) == 1
     ), "custom check is registered"
@@ -908,7 +1004,7 @@ def test_to_yaml_registered_dataframe_check(_):
     with pytest.raises(pandera.errors.SchemaError):
         schema.validate(pd.DataFrame(data={"a": [1]}))
 
-    assert ncols_gt_called, "did not call ncols_gt"
+    assert ncols_gt_registered["ncols_gt"], "did not call ncols_gt"
 
 
 def test_to_yaml_custom_dataframe_check():
@@ -981,11 +1077,14 @@ def test_to_yaml_retains_ordered_keyword(is_ordered, test_data, expected):
         assert validation_df.equals(expected)
 
 
-def test_serialize_deserialize_custom_datetime_checks():
+def test_serialize_deserialize_custom_datetime_checks(monkeypatch):
     """
     Test that custom checks for datetime columns can be serialized and
     deserialized
     """
+    # register the check onto a temporary registry so that it doesn't leak
+    # into other tests.
+    monkeypatch.setattr(pandera.Check, "REGISTERED_CUSTOM_CHECKS", {})
 
     # pylint: disable=unused-variable,unused-argument
     @pandera.extensions.register_check_method(statistics=["stat"])